@@ -3,50 +3,154 @@ Autonomous GPU Cluster Simulator
 Simulates real-world data center behavior with automatic job generation and fault injection
 """
 import time
+import heapq
+import itertools
+import queue
 import threading
 import random
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import partial
+import numpy as np
 from flask import Flask, render_template, jsonify, request
 from flask_socketio import SocketIO, emit
 
-from job_types import Job, JobStatus, JobPriority, job_executor_registry, create_job
+from job_types import Job, JobStatus, JobPriority, JobCancelled, job_executor_registry, create_job, warm_up_kernels, pin_blas_threads
 from gpu_monitor import gpu_monitor
-from utils import logger, generate_job_id
+from utils import logger, generate_job_id, monotonic_ns_to_iso, RWLock
 
+# Finished jobs kept for the dashboard; older ones are evicted
+MAX_JOB_HISTORY = 2000
 
-@dataclass
+# Chance that an online worker misses a heartbeat at each monitor check
+HEARTBEAT_FAILURE_CHANCE = 0.001
+
+# Auto-generated job mix: (job type, relative weight, parameter ranges)
+_JOB_TYPES = (
+    ("sleep", 0.3, {"duration": (1, 5)}),
+    ("compute", 0.4, {"iterations": (100000, 1000000)}),
+    ("matrix", 0.2, {"matrix_size": (500, 2000)}),
+    ("fault_injection", 0.1, {"failure_rate": (0.05, 0.2), "duration": (2, 8)})
+)
+_JOB_TYPE_PROBS = np.array([w for _, w, _ in _JOB_TYPES]) / sum(w for _, w, _ in _JOB_TYPES)
+
+# Realistic priority distribution
+_PRIORITIES = (JobPriority.LOW, JobPriority.NORMAL, JobPriority.HIGH, JobPriority.CRITICAL)
+_PRIORITY_PROBS = np.array([0.2, 0.5, 0.2, 0.1])
+
+# Generated jobs are drawn from pools of this many pre-sampled types, priorities and parameters
+JOB_POOL_SIZE = 10000
+
+
+def _sample_job_pool(rng: np.random.Generator, size: int = JOB_POOL_SIZE
+                     ) -> Tuple[np.ndarray, np.ndarray, Dict[str, Dict[str, np.ndarray]]]:
+    """Pre-draw job types, priorities and per-type parameters for the next `size` generated jobs"""
+    type_idx = rng.choice(len(_JOB_TYPES), size=size, p=_JOB_TYPE_PROBS)
+    priority_idx = rng.choice(len(_PRIORITIES), size=size, p=_PRIORITY_PROBS)
+    params = {
+        job_type: {
+            param: (rng.integers(min_val, max_val, size=size, endpoint=True) if isinstance(min_val, int)
+                    else rng.uniform(min_val, max_val, size))
+            for param, (min_val, max_val) in param_range.items()
+        }
+        for job_type, _, param_range in _JOB_TYPES
+    }
+    return type_idx, priority_idx, params
+
+
+class WorkerStatus(IntEnum):
+    """Worker status enumeration"""
+    ONLINE = 0
+    OFFLINE = 1
+    BUSY = 2
+    FAILED = 3
+
+
+# Dashboard names for each WorkerStatus, indexed by value
+_WORKER_STATUS_NAMES = tuple(status.name.lower() for status in WorkerStatus)
+
+
+@dataclass(slots=True)
 class WorkerInfo:
     """Worker node information"""
     worker_id: str
-    status: str  # "online", "offline", "busy", "failed"
+    status: WorkerStatus
     current_job: Optional[Job] = None
-    last_heartbeat: datetime = None
+    last_heartbeat_ns: int = field(default_factory=time.monotonic_ns)
+    last_heartbeat_iso: str = ""  # Formatted once per heartbeat, not on every status read
     failure_probability: float = 0.0  # Chance of failure per minute
     recovery_time: int = 30  # Seconds to recover after failure
     
     def __post_init__(self):
-        if self.last_heartbeat is None:
-            self.last_heartbeat = datetime.now()
+        if not self.last_heartbeat_iso:
+            self.last_heartbeat_iso = monotonic_ns_to_iso(self.last_heartbeat_ns)
     
     @property
     def is_available(self) -> bool:
-        return self.status == "online" and self.current_job is None
+        return self.status == WorkerStatus.ONLINE and self.current_job is None
 
 
 class AutonomousClusterSimulator:
     """Simulates autonomous GPU cluster behavior"""
     
-    def __init__(self):
+    def __init__(self, max_parallel_jobs: int = 8):
         self.workers: Dict[str, WorkerInfo] = {}
-        self.jobs: Dict[str, Job] = {}
-        self.job_queue: List[Job] = []
-        self.running = False
-        self.lock = threading.Lock()
+        self.jobs: Dict[str, Job] = {}  # Every job, in arrival order
+        # Finished jobs by completion, oldest first; the eviction order for the job history
+        self._finished_jobs: "OrderedDict[str, Job]" = OrderedDict()
+        # New and requeued jobs enter through a lock-free queue; None entries are scheduler wakeups
+        self._ingress: "queue.SimpleQueue[Optional[Job]]" = queue.SimpleQueue()
+        # Scheduler-owned min-heap of (-priority, sequence, job); the sequence keeps FIFO order
+        # within a priority. Only the scheduler thread modifies it; readers take list() copies.
+        self.job_queue: List[Tuple[int, int, Job]] = []
+        self._seq = itertools.count()
+        
+        # Set while the simulation is stopped; background loops sleep on it so stop() wakes them
+        self._stop_event = threading.Event()
+        self._stop_event.set()
+        
+        # Lock ordering: workers -> jobs -> stats. Never execute jobs while holding any of them.
+        # Status queries only take the read side, so dashboard clients don't serialize each other.
+        self._workers_lock = RWLock()  # Protects self.workers and worker/job assignment state
+        self._jobs_lock = RWLock()  # Protects self.jobs
+        self._stats_lock = RWLock()  # Protects self.stats
+        
+        # Worker ids indexed by status, so loops only visit the workers they care about
+        self._online: Set[str] = set()  # Idle and available for jobs
+        self._busy: Set[str] = set()
+        self._failed: Set[str] = set()
+        self._workers_by_status: Tuple[Set[str], ...] = (self._online, set(), self._busy, self._failed)  # By WorkerStatus
+        
+        # Worker ids and their per-second failure chances, replaced together when a worker is added
+        self._failure_table: Tuple[List[str], np.ndarray] = ([], np.zeros(0))
+        
+        # Pre-sampled job mix for the generator; refilled in the background when it wraps
+        self._rng = np.random.default_rng()  # Generator thread only
+        self._job_pool = _sample_job_pool(np.random.default_rng())
+        self._pool_idx = 0
+        
+        # Changes since the last status delta, so dashboard updates don't reserialize everything
+        self._dirty_lock = threading.Lock()  # Innermost lock; protects the sets and version below
+        self._dirty_jobs: Set[str] = set()
+        self._dirty_workers: Set[str] = set()
+        self._evicted_jobs: Set[str] = set()
+        self._version = 0
+        
+        # Jobs run here in parallel, one per busy worker. Each start() creates a fresh pool with a
+        # thread per worker (max_parallel_jobs while there are none), and add_worker() grows it, so
+        # assigned jobs never wait in the pool's queue. The lock orders submits against swaps.
+        self.max_parallel_jobs = max_parallel_jobs
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self._pool_size = 0
+        self._executor_lock = threading.Lock()  # Taken before the workers lock, never inside it
         
         # Simulation parameters
         self.job_generation_rate = 2.0  # Jobs per minute
+        self._jobs_per_second = self.job_generation_rate / 60.0  # Poisson arrival rate
         self.failure_rate = 0.1  # 10% chance of worker failure per hour
         self.recovery_time = 30  # Seconds to recover
         
@@ -58,28 +162,41 @@ class AutonomousClusterSimulator:
             'worker_failures': 0,
             'worker_recoveries': 0,
             'active_workers': 0,
-            'simulation_start': datetime.now()
+            'simulation_start': datetime.now().isoformat()
         }
+        self._start_ns = time.monotonic_ns()
+        
+        # Compile job kernels up front rather than on the first job
+        warm_up_kernels()
+        # Jobs run in parallel on the pool, so give each one a single BLAS thread
+        pin_blas_threads()
         
         # Start GPU monitoring
         gpu_monitor.start_monitoring()
         
         logger.info("Autonomous cluster simulator initialized")
     
+    @property
+    def running(self) -> bool:
+        """Whether the simulation threads should keep running"""
+        return not self._stop_event.is_set()
+    
     def set_job_generation_rate(self, rate: float):
         """Update the job generation rate"""
-        with self.lock:
-            self.job_generation_rate = rate
-            logger.info(f"Job generation rate updated to {rate} jobs/minute")
+        self.job_generation_rate = rate
+        self._jobs_per_second = rate / 60.0
+        logger.info(f"Job generation rate updated to {rate} jobs/minute")
     
     def start(self):
         """Start the autonomous simulation"""
-        self.running = True
+        with self._executor_lock:
+            self._pool_size = len(self.workers) or self.max_parallel_jobs
+            self.executor = ThreadPoolExecutor(max_workers=self._pool_size, thread_name_prefix="job")
+        self._stop_event.clear()
         
         # Start background tasks
         threading.Thread(target=self._job_generator, daemon=True).start()
         threading.Thread(target=self._job_scheduler, daemon=True).start()
-        threading.Thread(target=self._job_executor, daemon=True).start()
         threading.Thread(target=self._fault_injector, daemon=True).start()
         threading.Thread(target=self._worker_monitor, daemon=True).start()
         
@@ -87,118 +204,210 @@ class AutonomousClusterSimulator:
     
     def stop(self):
         """Stop the simulation"""
-        self.running = False
+        self._stop_event.set()
+        
+        # Wake the scheduler so it can observe the stop
+        self._ingress.put(None)
+        
+        # Interrupt running jobs that wait, rather than letting them sleep out their duration
+        with self._workers_lock.read:
+            for worker_id in self._busy:
+                self.workers[worker_id].current_job.cancel_event.set()
+        
+        # Jobs still queued in the pool are cancelled; their callbacks requeue them
+        with self._executor_lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
         gpu_monitor.stop_monitoring()
         logger.info("Autonomous cluster simulation stopped")
     
     def add_worker(self, worker_id: str, failure_probability: float = 0.1):
         """Add a worker with configurable failure probability"""
-        with self.lock:
+        with self._workers_lock.write:
+            if worker_id in self.workers:
+                self._workers_by_status[self.workers[worker_id].status].discard(worker_id)
             self.workers[worker_id] = WorkerInfo(
                 worker_id=worker_id,
-                status="online",
-                last_heartbeat=datetime.now(),
+                status=WorkerStatus.ONLINE,
                 failure_probability=failure_probability,
                 recovery_time=self.recovery_time
             )
-            self.stats['active_workers'] += 1
-            logger.info(f"Worker {worker_id} added (failure rate: {failure_probability:.1%}/min)")
+            self._online.add(worker_id)
+            self._failure_table = (
+                list(self.workers),
+                np.array([w.failure_probability for w in self.workers.values()]) / 60.0  # Per second
+            )
+        self._grow_executor()
+        self._ingress.put(None)
+        self._mark_dirty(worker_id=worker_id)
+        self._update_stats(active_workers=1)
+        logger.info(f"Worker {worker_id} added (failure rate: {failure_probability:.1%}/min)")
+    
+    def _grow_executor(self):
+        """Swap in a larger job pool once there are more workers than pool threads"""
+        with self._executor_lock:
+            if self.executor is None or not self.running or len(self.workers) <= self._pool_size:
+                return
+            old_executor = self.executor
+            self._pool_size = len(self.workers)
+            self.executor = ThreadPoolExecutor(max_workers=self._pool_size, thread_name_prefix="job")
+        # Jobs already on the old pool finish there and report through their callbacks
+        old_executor.shutdown(wait=False)
+    
+    def _set_worker_status(self, worker: WorkerInfo, status: WorkerStatus):
+        """Change a worker's status and move it to the matching index set (caller holds the workers lock)"""
+        self._workers_by_status[worker.status].discard(worker.worker_id)
+        worker.status = status
+        self._workers_by_status[status].add(worker.worker_id)
+    
+    def _push_pending(self, job: Job):
+        """Push a job onto the priority queue (scheduler thread only)"""
+        heapq.heappush(self.job_queue, (-job.priority, next(self._seq), job))
+    
+    def _record_finished_job(self, job: Job):
+        """Add a finished job to the eviction order and evict the oldest finished jobs
+        beyond MAX_JOB_HISTORY (caller holds the jobs lock)"""
+        # Finished jobs never change, so serialize once. The cache lives on the job because
+        # generated job ids can repeat.
+        job.finished_dict = job.to_dict()
+        if self.jobs.get(job.job_id) is not job:
+            # A newer job with the same id took this one's history slot, or it was evicted
+            return
+        finished = self._finished_jobs
+        finished[job.job_id] = job
+        finished.move_to_end(job.job_id)
+        
+        # Active jobs are never evicted, so pop only finished ones: O(evicted), however many are pending
+        evicted = []
+        while len(self.jobs) > MAX_JOB_HISTORY and finished:
+            job_id, old_job = finished.popitem(last=False)
+            if self.jobs.get(job_id) is old_job:
+                del self.jobs[job_id]
+                evicted.append(job_id)
+        if not evicted:
+            return
+        
+        with self._dirty_lock:
+            self._evicted_jobs.update(evicted)
+    
+    def _mark_dirty(self, job: Optional[Job] = None, worker_id: Optional[str] = None):
+        """Record a job or worker change for the next status delta (call after the change)"""
+        with self._dirty_lock:
+            if job is not None:
+                self._dirty_jobs.add(job.job_id)
+            if worker_id is not None:
+                self._dirty_workers.add(worker_id)
+    
+    def _update_stats(self, **deltas: int):
+        """Apply counter deltas to the statistics"""
+        with self._stats_lock.write:
+            for key, delta in deltas.items():
+                self.stats[key] += delta
     
     def _job_generator(self):
         """Automatically generate realistic jobs"""
-        job_types = [
-            ("sleep", 0.3, {"duration": (1, 5)}),
-            ("compute", 0.4, {"iterations": (100000, 1000000)}),
-            ("matrix", 0.2, {"matrix_size": (500, 2000)}),
-            ("fault_injection", 0.1, {"failure_rate": (0.05, 0.2), "duration": (2, 8)})
-        ]
+        wait = self._stop_event.wait
         
         while self.running:
             try:
-                # Generate job based on rate
-                if random.random() < (self.job_generation_rate / 60.0):
-                    job_type, weight, param_range = random.choices(
-                        job_types, 
-                        weights=[w for _, w, _ in job_types]
-                    )[0]
-                    
-                    # Generate parameters
-                    params = {}
-                    for param, (min_val, max_val) in param_range.items():
-                        if isinstance(min_val, int):
-                            params[param] = random.randint(min_val, max_val)
-                        else:
-                            params[param] = random.uniform(min_val, max_val)
-                    
-                    # Create job with realistic priority distribution
-                    priority_weights = [0.2, 0.5, 0.2, 0.1]  # LOW, NORMAL, HIGH, CRITICAL
-                    priority = random.choices(
-                        [JobPriority.LOW, JobPriority.NORMAL, JobPriority.HIGH, JobPriority.CRITICAL],
-                        weights=priority_weights
-                    )[0]
+                # Jobs arriving this second follow a Poisson distribution at the configured rate
+                count = int(self._rng.poisson(self._jobs_per_second))
+                if count:
+                    jobs = [self._next_pooled_job() for _ in range(count)]
                     
-                    job = create_job(job_type, priority, params)
+                    with self._jobs_lock.write:
+                        for job in jobs:
+                            self.jobs[job.job_id] = job
+                    for job in jobs:
+                        self._ingress.put(job)
+                    with self._dirty_lock:
+                        self._dirty_jobs.update(job.job_id for job in jobs)
+                    self._update_stats(total_jobs=count)
                     
-                    with self.lock:
-                        self.jobs[job.job_id] = job
-                        self.job_queue.append(job)
-                        self.stats['total_jobs'] += 1
-                    
-                    logger.info(f"Auto-generated {job.job_type} job: {job.job_id} (priority: {job.priority.name})")
+                    for job in jobs:
+                        logger.info(f"Auto-generated {job.job_type} job: {job.job_id} (priority: {job.priority.name})")
                 
-                time.sleep(1)  # Check every second
+                wait(1)  # Check every second
                 
             except Exception as e:
                 logger.error(f"Error in job generator: {e}")
-                time.sleep(1)
+                wait(1)
+    
+    def _next_pooled_job(self) -> Job:
+        """Create a job from the next pre-sampled type, priority and parameters (generator thread only)"""
+        type_idx, priority_idx, param_pools = self._job_pool
+        i = self._pool_idx
+        job_type = _JOB_TYPES[type_idx[i]][0]
+        priority = _PRIORITIES[priority_idx[i]]
+        params = {param: values[i].item() for param, values in param_pools[job_type].items()}
+        
+        self._pool_idx = i + 1
+        if self._pool_idx == JOB_POOL_SIZE:
+            self._pool_idx = 0
+            threading.Thread(target=self._refill_job_pool, daemon=True).start()
+        
+        return create_job(job_type, priority, params)
+    
+    def _refill_job_pool(self):
+        """Replace the generator's job pool with fresh samples"""
+        self._job_pool = _sample_job_pool(np.random.default_rng())
     
     def _fault_injector(self):
         """Simulate realistic worker failures"""
         while self.running:
             try:
-                with self.lock:
-                    for worker_id, worker in self.workers.items():
-                        if worker.status == "online":
-                            # Check if worker should fail based on probability
-                            failure_chance = worker.failure_probability / 60.0  # Per second
-                            if random.random() < failure_chance:
+                # Draw for every worker at once outside the lock, then only visit the unlucky ones
+                worker_ids, thresholds = self._failure_table
+                failed = np.flatnonzero(np.random.random(len(worker_ids)) < thresholds)
+                
+                if failed.size:
+                    with self._workers_lock.write:
+                        for i in failed:
+                            worker_id = worker_ids[i]
+                            if worker_id in self._online:
                                 self._simulate_worker_failure(worker_id)
                 
-                time.sleep(5)  # Check every 5 seconds
+                self._stop_event.wait(5)  # Check every 5 seconds
                 
             except Exception as e:
                 logger.error(f"Error in fault injector: {e}")
-                time.sleep(5)
+                self._stop_event.wait(5)
     
     def _simulate_worker_failure(self, worker_id: str):
         """Simulate a worker failure"""
-        worker = self.workers[worker_id]
-        
-        logger.warning(f"🚨 WORKER FAILURE: {worker_id} has failed!")
-        
-        # Mark worker as failed
-        worker.status = "failed"
-        self.stats['worker_failures'] += 1
-        self.stats['active_workers'] -= 1
-        
-        # If worker has a job, requeue it
-        if worker.current_job:
-            job = worker.current_job
-            job.status = JobStatus.PENDING
-            job.worker_id = None
-            job.started_at = None
-            job.retry_count += 1
+        with self._workers_lock.write:
+            worker = self.workers[worker_id]
             
-            if job.retry_count <= job.max_retries:
-                self.job_queue.append(job)
-                logger.info(f"Job {job.job_id} requeued due to worker failure (retry {job.retry_count})")
-            else:
-                job.status = JobStatus.FAILED
-                job.error_message = "Max retries exceeded due to worker failures"
-                self.stats['failed_jobs'] += 1
-                logger.error(f"Job {job.job_id} failed after max retries")
+            logger.warning(f"🚨 WORKER FAILURE: {worker_id} has failed!")
             
-            worker.current_job = None
+            # Mark worker as failed
+            self._set_worker_status(worker, WorkerStatus.FAILED)
+            self._update_stats(worker_failures=1, active_workers=-1)
+            
+            # If worker has a job, requeue it
+            if worker.current_job:
+                job = worker.current_job
+                job.status = JobStatus.PENDING
+                job.worker_id = None
+                job.started_at_ns = None
+                job.started_at_iso = None
+                job.retry_count += 1
+                
+                if job.retry_count <= job.max_retries:
+                    self._ingress.put(job)
+                    logger.info(f"Job {job.job_id} requeued due to worker failure (retry {job.retry_count})")
+                else:
+                    job.status = JobStatus.FAILED
+                    job.error_message = "Max retries exceeded due to worker failures"
+                    with self._jobs_lock.write:
+                        self._record_finished_job(job)
+                    self._update_stats(failed_jobs=1)
+                    logger.error(f"Job {job.job_id} failed after max retries")
+                
+                worker.current_job = None
+                self._mark_dirty(job)
+            
+            self._mark_dirty(worker_id=worker_id)
         
         # Schedule recovery
         threading.Thread(
@@ -209,140 +418,303 @@ class AutonomousClusterSimulator:
     
     def _recover_worker(self, worker_id: str):
         """Simulate worker recovery after failure"""
-        time.sleep(self.recovery_time)
+        if self._stop_event.wait(self.recovery_time):
+            return
         
-        with self.lock:
-            if worker_id in self.workers:
-                worker = self.workers[worker_id]
-                worker.status = "online"
-                worker.last_heartbeat = datetime.now()
-                self.stats['worker_recoveries'] += 1
-                self.stats['active_workers'] += 1
-                
-                logger.info(f"🔄 WORKER RECOVERY: {worker_id} is back online!")
+        with self._workers_lock.write:
+            if worker_id not in self.workers:
+                return
+            worker = self.workers[worker_id]
+            self._set_worker_status(worker, WorkerStatus.ONLINE)
+            worker.last_heartbeat_ns = time.monotonic_ns()
+            worker.last_heartbeat_iso = monotonic_ns_to_iso(worker.last_heartbeat_ns)
+        self._ingress.put(None)
+        
+        self._mark_dirty(worker_id=worker_id)
+        self._update_stats(worker_recoveries=1, active_workers=1)
+        logger.info(f"🔄 WORKER RECOVERY: {worker_id} is back online!")
     
     def _worker_monitor(self):
         """Monitor worker health and simulate heartbeat failures"""
         while self.running:
             try:
-                current_time = datetime.now()
+                current_time = time.monotonic_ns()
+                current_time_iso = monotonic_ns_to_iso(current_time)
                 
-                with self.lock:
-                    for worker_id, worker in self.workers.items():
-                        if worker.status == "online":
-                            # Simulate occasional heartbeat failures
-                            if random.random() < 0.001:  # 0.1% chance per check
-                                self._simulate_worker_failure(worker_id)
-                            else:
-                                worker.last_heartbeat = current_time
+                # Simulate occasional heartbeat failures, drawn for all workers at once
+                worker_ids = self._failure_table[0]
+                missed = {worker_ids[i] for i in np.flatnonzero(
+                    np.random.random(len(worker_ids)) < HEARTBEAT_FAILURE_CHANCE
+                )}
                 
-                time.sleep(10)  # Check every 10 seconds
+                with self._workers_lock.write:
+                    for worker_id in list(self._online):
+                        if worker_id in missed:
+                            self._simulate_worker_failure(worker_id)
+                        else:
+                            worker = self.workers[worker_id]
+                            worker.last_heartbeat_ns = current_time
+                            worker.last_heartbeat_iso = current_time_iso
+                            self._mark_dirty(worker_id=worker_id)
+                
+                self._stop_event.wait(10)  # Check every 10 seconds
                 
             except Exception as e:
                 logger.error(f"Error in worker monitor: {e}")
-                time.sleep(10)
+                self._stop_event.wait(10)
     
     def _job_scheduler(self):
         """Schedule jobs to available workers"""
+        ingress = self._ingress
+        
         while self.running:
             try:
-                with self.lock:
-                    if self.job_queue:
-                        # Sort jobs by priority
-                        self.job_queue.sort(key=lambda job: job.priority.value, reverse=True)
-                        
-                        # Find available workers
-                        available_workers = [w for w in self.workers.values() if w.is_available]
-                        
-                        if available_workers:
-                            job = self.job_queue.pop(0)
-                            # Choose worker with lowest current load (simple load balancing)
-                            worker = random.choice(available_workers)
-                            
-                            # Assign job to worker
-                            worker.current_job = job
-                            worker.status = "busy"
-                            job.status = JobStatus.RUNNING
-                            job.started_at = datetime.now()
-                            job.worker_id = worker.worker_id
-                            
-                            logger.info(f"Job {job.job_id} assigned to worker {worker.worker_id}")
+                # Block until a job arrives or a worker frees up, unless there's work to dispatch now
+                if not (self.job_queue and self._online):
+                    job = ingress.get()
+                    if job is not None:
+                        self._push_pending(job)
                 
-                time.sleep(0.5)
+                # Drain everything else that arrived into the priority heap
+                while True:
+                    try:
+                        job = ingress.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job is not None:
+                        self._push_pending(job)
                 
-            except Exception as e:
-                logger.error(f"Error in job scheduler: {e}")
-                time.sleep(0.5)
-    
-    def _job_executor(self):
-        """Execute jobs assigned to workers"""
-        while self.running:
-            try:
-                with self.lock:
-                    for worker in self.workers.values():
-                        if worker.current_job and worker.current_job.status == JobStatus.RUNNING:
-                            job = worker.current_job
-                            
-                            # Execute the job
-                            try:
-                                result = job_executor_registry.execute_job(job)
-                                
-                                # Mark job as completed
-                                job.status = JobStatus.COMPLETED
-                                job.completed_at = datetime.now()
-                                job.result = result
-                                self.stats['completed_jobs'] += 1
-                                
-                                logger.info(f"✅ Job {job.job_id} completed successfully on {worker.worker_id}")
-                                
-                            except Exception as e:
-                                # Mark job as failed
-                                job.status = JobStatus.FAILED
-                                job.completed_at = datetime.now()
-                                job.error_message = str(e)
-                                self.stats['failed_jobs'] += 1
-                                
-                                logger.error(f"❌ Job {job.job_id} failed on {worker.worker_id}: {e}")
-                            
-                            # Free the worker
-                            worker.current_job = None
-                            worker.status = "online"
+                if not self.running:
+                    break
+                if not (self.job_queue and self._online):
+                    continue
                 
-                time.sleep(1)
+                with self._workers_lock.write:
+                    assignments = self._dispatch_ready_jobs()
+                
+                with self._executor_lock:
+                    for i, (worker, job) in enumerate(assignments):
+                        try:
+                            future = self.executor.submit(self._run_job, job)
+                        except RuntimeError:
+                            # Pool already shut down (stop() or interpreter exit); don't strand the rest
+                            self._release_assignments(assignments[i:])
+                            raise
+                        future.add_done_callback(partial(self._on_job_done, worker, job))
+                        logger.info(f"Job {job.job_id} assigned to worker {worker.worker_id}")
                 
             except Exception as e:
-                logger.error(f"Error in job executor: {e}")
-                time.sleep(1)
+                logger.error(f"Error in job scheduler: {e}")
+                self._stop_event.wait(0.5)
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get current simulation status"""
-        with self.lock:
-            uptime = (datetime.now() - self.stats['simulation_start']).total_seconds()
+    def _dispatch_ready_jobs(self) -> List[Tuple[WorkerInfo, Job]]:
+        """Pair as many queued jobs with idle workers as possible in one pass
+        (scheduler thread, holding the workers lock)"""
+        count = min(len(self.job_queue), len(self._online))
+        # Highest priority jobs, oldest first
+        heappop = heapq.heappop
+        pending = self.job_queue
+        jobs = [heappop(pending)[2] for _ in range(count)]
+        
+        # Spread the batch over randomly chosen idle workers (simple load balancing)
+        workers = [self.workers[worker_id] for worker_id in random.sample(tuple(self._online), count)]
+        
+        started_at_ns = time.monotonic_ns()
+        started_at_iso = monotonic_ns_to_iso(started_at_ns)
+        for worker, job in zip(workers, jobs):
+            # Assign job to worker
+            worker.current_job = job
+            self._set_worker_status(worker, WorkerStatus.BUSY)
+            job.status = JobStatus.RUNNING
+            job.started_at_ns = started_at_ns
+            job.started_at_iso = started_at_iso
+            job.worker_id = worker.worker_id
+        
+        with self._dirty_lock:
+            self._dirty_jobs.update(job.job_id for job in jobs)
+            self._dirty_workers.update(worker.worker_id for worker in workers)
+        
+        return list(zip(workers, jobs))
+    
+    def _release_assignments(self, assignments: List[Tuple[WorkerInfo, Job]]):
+        """Undo assignments whose jobs never ran (refused or cancelled by the pool): free the
+        workers and requeue the jobs"""
+        released = []
+        with self._workers_lock.write:
+            for worker, job in assignments:
+                if worker.current_job is not job:
+                    # The worker failed meanwhile and the job was already requeued or failed
+                    continue
+                worker.current_job = None
+                self._set_worker_status(worker, WorkerStatus.ONLINE)
+                job.status = JobStatus.PENDING
+                job.worker_id = None
+                job.started_at_ns = None
+                job.started_at_iso = None
+                job.cancel_event.clear()  # Set by stop() for every assigned job
+                released.append((worker, job))
+        
+        with self._dirty_lock:
+            self._dirty_jobs.update(job.job_id for _, job in released)
+            self._dirty_workers.update(worker.worker_id for worker, _ in released)
+        for _, job in released:
+            self._ingress.put(job)
+    
+    def _run_job(self, job: Job) -> Any:
+        """Execute a job on a pool thread without holding any lock"""
+        return job_executor_registry.execute_job(job)
+    
+    def _on_job_done(self, worker: WorkerInfo, job: Job, future: Future):
+        """Record a finished job's outcome and free its worker"""
+        if future.cancelled():
+            # Still queued in the pool when stop() shut it down
+            self._release_assignments([(worker, job)])
+            return
+        error = future.exception()
+        
+        with self._workers_lock.write:
+            if worker.current_job is not job:
+                # The worker failed mid-run and the job was already requeued or failed
+                logger.info(f"Discarding result of job {job.job_id}: worker {worker.worker_id} lost it")
+                return
             
-            # Create a copy of stats with datetime converted to string
-            stats_copy = self.stats.copy()
-            stats_copy['simulation_start'] = self.stats['simulation_start'].isoformat()
+            job.completed_at_ns = time.monotonic_ns()
+            job.completed_at_iso = monotonic_ns_to_iso(job.completed_at_ns)
+            if error is None:
+                # Mark job as completed
+                job.status = JobStatus.COMPLETED
+                job.result = future.result()
+            elif isinstance(error, JobCancelled):
+                job.status = JobStatus.CANCELLED
+            else:
+                # Mark job as failed
+                job.status = JobStatus.FAILED
+                job.error_message = str(error)
+            with self._jobs_lock.write:
+                self._record_finished_job(job)
             
-            return {
-                'simulation_info': {
-                    'uptime': uptime,
-                    'job_generation_rate': self.job_generation_rate,
-                    'failure_rate': self.failure_rate,
-                    'recovery_time': self.recovery_time
-                },
-                'workers': {worker_id: {
-                    'worker_id': worker.worker_id,
-                    'status': worker.status,
-                    'failure_probability': worker.failure_probability,
-                    'current_job': worker.current_job.to_dict() if worker.current_job else None,
-                    'is_available': worker.is_available,
-                    'last_heartbeat': worker.last_heartbeat.isoformat()
-                } for worker_id, worker in self.workers.items()},
-                'jobs': {job_id: job.to_dict() for job_id, job in self.jobs.items()},
-                'job_queue': [job.to_dict() for job in self.job_queue],
-                'stats': stats_copy,
-                'gpu_info': gpu_monitor.get_system_info()
-            }
+            # Free the worker
+            worker.current_job = None
+            self._set_worker_status(worker, WorkerStatus.ONLINE)
+        self._ingress.put(None)
+        
+        self._mark_dirty(job, worker.worker_id)
+        
+        if error is None:
+            self._update_stats(completed_jobs=1)
+            logger.info(f"✅ Job {job.job_id} completed successfully on {worker.worker_id}")
+        elif job.status == JobStatus.CANCELLED:
+            logger.info(f"🛑 Job {job.job_id} cancelled on {worker.worker_id}")
+        else:
+            self._update_stats(failed_jobs=1)
+            logger.error(f"❌ Job {job.job_id} failed on {worker.worker_id}: {error}")
+    
+    def _worker_to_dict(self, worker: WorkerInfo) -> Dict[str, Any]:
+        """Serialize a worker for the dashboard (caller holds the workers lock)"""
+        return {
+            'worker_id': worker.worker_id,
+            'status': _WORKER_STATUS_NAMES[worker.status],
+            'failure_probability': worker.failure_probability,
+            'current_job': worker.current_job.to_dict() if worker.current_job else None,
+            'is_available': worker.is_available,
+            'last_heartbeat': worker.last_heartbeat_iso
+        }
+    
+    def _job_to_dict(self, job: Job) -> Dict[str, Any]:
+        """Serialize a job, reusing the stored form of finished jobs (caller holds the jobs lock)"""
+        return job.finished_dict if job.finished_dict is not None else job.to_dict()
+    
+    def _summary(self) -> Dict[str, Any]:
+        """Simulation info, stats and GPU overview shared by full and delta status"""
+        with self._stats_lock.read:
+            stats_copy = self.stats.copy()
+        uptime = (time.monotonic_ns() - self._start_ns) / 1e9
+        
+        return {
+            'simulation_info': {
+                'uptime': uptime,
+                'job_generation_rate': self.job_generation_rate,
+                'failure_rate': self.failure_rate,
+                'recovery_time': self.recovery_time
+            },
+            'stats': stats_copy,
+            'gpu_info': gpu_monitor.get_system_info()
+        }
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get current simulation status"""
+        with self._dirty_lock:
+            version = self._version
+        
+        with self._workers_lock.read:
+            workers = {worker_id: self._worker_to_dict(worker) for worker_id, worker in self.workers.items()}
+        
+        with self._jobs_lock.read:
+            jobs = {job_id: self._job_to_dict(job) for job_id, job in self.jobs.items()}
+        job_queue = [entry[2].to_dict() for entry in list(self.job_queue)]
+        
+        return {
+            'version': version,
+            'workers': workers,
+            'jobs': jobs,
+            'job_queue': job_queue,
+            'queue_size': len(job_queue),
+            **self._summary()
+        }
+    
+    def get_status_delta(self) -> Dict[str, Any]:
+        """Get the jobs and workers that changed since the previous delta.
+        
+        Deltas are numbered; a client holding status version N applies the delta
+        whose prev_version is N, and requests a full status when it detects a gap.
+        """
+        with self._dirty_lock:
+            dirty_jobs, self._dirty_jobs = self._dirty_jobs, set()
+            dirty_workers, self._dirty_workers = self._dirty_workers, set()
+            evicted_jobs, self._evicted_jobs = self._evicted_jobs, set()
+            self._version += 1
+            version = self._version
+        
+        with self._workers_lock.read:
+            workers_delta = {worker_id: self._worker_to_dict(self.workers[worker_id])
+                             for worker_id in dirty_workers if worker_id in self.workers}
+        
+        with self._jobs_lock.read:
+            jobs_delta = {job_id: self._job_to_dict(self.jobs[job_id])
+                          for job_id in dirty_jobs if job_id in self.jobs}
+        queue_size = len(self.job_queue)
+        
+        return {
+            'version': version,
+            'prev_version': version - 1,
+            'workers_delta': workers_delta,
+            'jobs_delta': jobs_delta,
+            'jobs_removed': list(evicted_jobs),
+            'queue_size': queue_size,
+            **self._summary()
+        }
+
+
+def coalesce_status_deltas(deltas: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Fold consecutive status deltas into one equivalent delta; the latest values win"""
+    workers_delta: Dict[str, Any] = {}
+    jobs_delta: Dict[str, Any] = {}
+    jobs_removed: Set[str] = set()
+    
+    for delta in deltas:
+        for job_id in delta['jobs_removed']:
+            jobs_delta.pop(job_id, None)
+            jobs_removed.add(job_id)
+        jobs_delta.update(delta['jobs_delta'])
+        workers_delta.update(delta['workers_delta'])
+    
+    return {
+        **deltas[-1],
+        'prev_version': deltas[0]['prev_version'],
+        'workers_delta': workers_delta,
+        'jobs_delta': jobs_delta,
+        'jobs_removed': list(jobs_removed)
+    }
 
 
 # Global simulator instance
@@ -364,6 +736,12 @@ def get_status():
     return jsonify(simulator.get_status())
 
 
+@socketio.on('request_update')
+def handle_request_update():
+    """Send a full status to a client that is (re)synchronizing"""
+    emit('status_update', simulator.get_status())
+
+
 @app.route('/api/update-job-rate', methods=['POST'])
 def update_job_rate():
     """Update the job generation rate"""
@@ -411,17 +789,41 @@ def start_autonomous_simulation():
     simulator.add_worker("gpu-node-07", failure_probability=0.09)  # 9% failure rate
     simulator.add_worker("gpu-node-08", failure_probability=0.11)  # 11% failure rate
     
-    # Start background updates
+    # Start background updates. Deltas are produced on a fixed tick and sent by a separate
+    # thread, so slow socket writes never delay the tick; if the sender falls behind, the
+    # pending deltas go out as one coalesced emit. A delta dropped from the bounded buffer
+    # shows up as a version gap and the dashboard resynchronizes.
+    pending_deltas = deque(maxlen=4)
+    deltas_ready = threading.Condition()
+    
     def update_loop():
         while simulator.running:
             try:
-                socketio.emit('status_update', simulator.get_status())
+                delta = simulator.get_status_delta()
+                with deltas_ready:
+                    pending_deltas.append(delta)
+                    deltas_ready.notify()
                 time.sleep(0.5)  # Update every 500ms for smooth experience
             except Exception as e:
                 logger.error(f"Error in update loop: {e}")
                 time.sleep(0.5)
     
+    def emit_loop():
+        while simulator.running:
+            try:
+                with deltas_ready:
+                    deltas_ready.wait_for(lambda: pending_deltas, timeout=1.0)
+                    batch = list(pending_deltas)
+                    pending_deltas.clear()
+                
+                if batch:
+                    socketio.emit('status_delta', coalesce_status_deltas(batch))
+            except Exception as e:
+                logger.error(f"Error in emit loop: {e}")
+                time.sleep(0.5)
+    
     threading.Thread(target=update_loop, daemon=True).start()
+    threading.Thread(target=emit_loop, daemon=True).start()
     
     logger.info("Autonomous simulation started!")
     logger.info("Simulating real-world data center behavior:")
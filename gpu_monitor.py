@@ -4,8 +4,10 @@ GPU monitoring and resource management for the GPU Mini-Cluster Orchestrator
 import time
 import threading
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from functools import cached_property
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
+import numpy as np
 import psutil
 
 try:
@@ -15,7 +17,7 @@ except ImportError:
     NVML_AVAILABLE = False
 
 
-@dataclass
+@dataclass(slots=True)
 class GPUInfo:
     """GPU information data structure"""
     gpu_id: int
@@ -59,16 +61,58 @@ class GPUInfo:
         }
 
 
+@dataclass(frozen=True)
+class GPUSnapshot:
+    """One set of GPU readings, as parallel arrays indexed by GPU id.
+    
+    Published by the monitor loop with a single reference assignment and never
+    modified afterwards, so readers can use it without locking.
+    """
+    names: Tuple[str, ...]
+    memory_total: np.ndarray  # bytes
+    memory_used: np.ndarray   # bytes
+    utilization_gpu: np.ndarray  # percentage
+    utilization_memory: np.ndarray  # percentage
+    temperature: np.ndarray  # celsius
+    power_usage: np.ndarray  # watts
+    available_idx: np.ndarray  # GPUs below 90% memory usage
+    system_info: Dict[str, Any]  # Aggregates, computed once when the snapshot is built
+    last_updated: datetime
+    
+    @cached_property
+    def gpus(self) -> Tuple[GPUInfo, ...]:
+        """GPUInfo objects for this snapshot, built on first use"""
+        mem_total = self.memory_total.tolist()
+        mem_used = self.memory_used.tolist()
+        return tuple(
+            GPUInfo(
+                gpu_id=i,
+                name=name,
+                memory_total=mem_total[i],
+                memory_used=mem_used[i],
+                memory_free=mem_total[i] - mem_used[i],
+                utilization_gpu=util_gpu,
+                utilization_memory=util_mem,
+                temperature=temp,
+                power_usage=power,
+                last_updated=self.last_updated
+            )
+            for i, (name, util_gpu, util_mem, temp, power) in enumerate(zip(
+                self.names, self.utilization_gpu.tolist(), self.utilization_memory.tolist(),
+                self.temperature.tolist(), self.power_usage.tolist()
+            ))
+        )
+
+
 class GPUMonitor:
     """GPU monitoring and management class"""
     
     def __init__(self, check_interval: float = 1.0, num_gpus: int = 8):
         self.check_interval = check_interval
         self.num_gpus = num_gpus
-        self.gpus: Dict[int, GPUInfo] = {}
         self.monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
-        self.lock = threading.Lock()
+        self._rng = np.random.default_rng()
         
         # Initialize NVML if available
         if NVML_AVAILABLE:
@@ -81,6 +125,12 @@ class GPUMonitor:
         else:
             self.nvml_available = False
             print("Warning: pynvml not available, using simulated GPU data")
+        
+        # Latest readings; replaced wholesale by the monitor loop, read without locking
+        self._snapshot = self._make_snapshot(
+            (), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64),
+            np.zeros(0), np.zeros(0), np.zeros(0), np.zeros(0)
+        )
     
     def start_monitoring(self):
         """Start GPU monitoring in background thread"""
@@ -109,52 +159,84 @@ class GPUMonitor:
     
     def _update_gpu_info(self):
         """Update GPU information"""
-        with self.lock:
-            if self.nvml_available:
-                self._update_real_gpu_info()
-            else:
-                self._update_simulated_gpu_info()
+        if self.nvml_available:
+            self._update_real_gpu_info()
+        else:
+            self._update_simulated_gpu_info()
+    
+    def _make_snapshot(self, names, mem_total, mem_used, util_gpu, util_mem, temp, power) -> GPUSnapshot:
+        """Build an immutable snapshot, including system aggregates, from per-GPU arrays"""
+        # Same rule as GPUInfo.is_available: less than 90% memory used
+        usage = np.divide(mem_used, mem_total, out=np.zeros(len(names)), where=mem_total > 0)
+        available_idx = np.flatnonzero(usage < 0.9)
+        
+        total_gpus = len(names)
+        total_memory = int(mem_total.sum())
+        used_memory = int(mem_used.sum())
+        system_info = {
+            'total_gpus': total_gpus,
+            'available_gpus': len(available_idx),
+            'total_memory': total_memory,
+            'used_memory': used_memory,
+            'memory_usage_percent': used_memory / max(total_memory, 1),
+            'avg_utilization': float(util_gpu.sum()) / max(total_gpus, 1),
+            'avg_temperature': float(temp.sum()) / max(total_gpus, 1),
+            'nvml_available': self.nvml_available
+        }
+        
+        return GPUSnapshot(
+            names=tuple(names),
+            memory_total=mem_total,
+            memory_used=mem_used,
+            utilization_gpu=util_gpu,
+            utilization_memory=util_mem,
+            temperature=temp,
+            power_usage=power,
+            available_idx=available_idx,
+            system_info=system_info,
+            last_updated=datetime.now()
+        )
     
     def _update_real_gpu_info(self):
         """Update real GPU information using NVML"""
         try:
             device_count = pynvml.nvmlDeviceGetCount()
             
+            names = []
+            mem_total, mem_used = [], []
+            util_gpu, util_mem = [], []
+            temp, power = [], []
             for i in range(device_count):
                 handle = pynvml.nvmlDeviceGetHandleByIndex(i)
                 
                 # Get GPU name
-                name = pynvml.nvmlDeviceGetName(handle).decode('utf-8')
+                names.append(pynvml.nvmlDeviceGetName(handle).decode('utf-8'))
                 
                 # Get memory info
                 memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
-                memory_total = memory_info.total
-                memory_used = memory_info.used
-                memory_free = memory_info.free
+                mem_total.append(memory_info.total)
+                mem_used.append(memory_info.used)
                 
                 # Get utilization
                 utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
-                utilization_gpu = utilization.gpu
-                utilization_memory = utilization.memory
+                util_gpu.append(utilization.gpu)
+                util_mem.append(utilization.memory)
                 
                 # Get temperature
-                temperature = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+                temp.append(pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU))
                 
                 # Get power usage
-                power_usage = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # Convert to watts
-                
-                self.gpus[i] = GPUInfo(
-                    gpu_id=i,
-                    name=name,
-                    memory_total=memory_total,
-                    memory_used=memory_used,
-                    memory_free=memory_free,
-                    utilization_gpu=utilization_gpu,
-                    utilization_memory=utilization_memory,
-                    temperature=temperature,
-                    power_usage=power_usage,
-                    last_updated=datetime.now()
-                )
+                power.append(pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0)  # Convert to watts
+            
+            self._snapshot = self._make_snapshot(
+                names,
+                np.array(mem_total, dtype=np.int64),
+                np.array(mem_used, dtype=np.int64),
+                np.array(util_gpu, dtype=np.float64),
+                np.array(util_mem, dtype=np.float64),
+                np.array(temp, dtype=np.float64),
+                np.array(power, dtype=np.float64)
+            )
                 
         except Exception as e:
             print(f"Error updating real GPU info: {e}")
@@ -162,41 +244,39 @@ class GPUMonitor:
     
     def _update_simulated_gpu_info(self):
         """Update simulated GPU information"""
-        import random
+        # Simulate 8 GPUs to match the 8 GPU nodes, one vectorized draw per metric
+        n = self.num_gpus
+        rng = self._rng
+        base_memory_total = 8 * 1024 * 1024 * 1024  # 8GB
         
-        # Simulate 8 GPUs to match the 8 GPU nodes
-        for i in range(self.num_gpus):
-            # Simulate some variation in GPU usage
-            base_memory_total = 8 * 1024 * 1024 * 1024  # 8GB
-            base_memory_used = random.randint(0, int(base_memory_total * 0.7))
-            
-            self.gpus[i] = GPUInfo(
-                gpu_id=i,
-                name=f"Simulated GPU {i}",
-                memory_total=base_memory_total,
-                memory_used=base_memory_used,
-                memory_free=base_memory_total - base_memory_used,
-                utilization_gpu=random.uniform(0, 100),
-                utilization_memory=random.uniform(0, 100),
-                temperature=random.uniform(30, 80),
-                power_usage=random.uniform(50, 200),
-                last_updated=datetime.now()
-            )
+        names = self._snapshot.names
+        if len(names) != n:
+            names = [f"Simulated GPU {i}" for i in range(n)]
+        
+        self._snapshot = self._make_snapshot(
+            names,
+            np.full(n, base_memory_total, dtype=np.int64),
+            rng.integers(0, int(base_memory_total * 0.7), size=n, endpoint=True),
+            rng.uniform(0, 100, n),
+            rng.uniform(0, 100, n),
+            rng.uniform(30, 80, n),
+            rng.uniform(50, 200, n)
+        )
     
     def get_gpu_info(self, gpu_id: int) -> Optional[GPUInfo]:
         """Get information for a specific GPU"""
-        with self.lock:
-            return self.gpus.get(gpu_id)
+        gpus = self._snapshot.gpus
+        return gpus[gpu_id] if 0 <= gpu_id < len(gpus) else None
     
     def get_all_gpus(self) -> List[GPUInfo]:
         """Get information for all GPUs"""
-        with self.lock:
-            return list(self.gpus.values())
+        return list(self._snapshot.gpus)
     
     def get_available_gpus(self) -> List[GPUInfo]:
         """Get list of available GPUs"""
-        with self.lock:
-            return [gpu for gpu in self.gpus.values() if gpu.is_available]
+        snapshot = self._snapshot
+        gpus = snapshot.gpus
+        return [gpus[i] for i in snapshot.available_idx]
     
     def get_best_gpu(self) -> Optional[GPUInfo]:
         """Get the best available GPU (lowest memory usage)"""
@@ -208,31 +288,11 @@ class GPUMonitor:
     
     def get_gpu_count(self) -> int:
         """Get number of GPUs"""
-        with self.lock:
-            return len(self.gpus)
+        return len(self._snapshot.names)
     
     def get_system_info(self) -> Dict[str, Any]:
         """Get overall system information"""
-        with self.lock:
-            total_gpus = len(self.gpus)
-            available_gpus = len([gpu for gpu in self.gpus.values() if gpu.is_available])
-            
-            total_memory = sum(gpu.memory_total for gpu in self.gpus.values())
-            used_memory = sum(gpu.memory_used for gpu in self.gpus.values())
-            
-            avg_utilization = sum(gpu.utilization_gpu for gpu in self.gpus.values()) / max(total_gpus, 1)
-            avg_temperature = sum(gpu.temperature for gpu in self.gpus.values()) / max(total_gpus, 1)
-            
-            return {
-                'total_gpus': total_gpus,
-                'available_gpus': available_gpus,
-                'total_memory': total_memory,
-                'used_memory': used_memory,
-                'memory_usage_percent': used_memory / max(total_memory, 1),
-                'avg_utilization': avg_utilization,
-                'avg_temperature': avg_temperature,
-                'nvml_available': self.nvml_available
-            }
+        return dict(self._snapshot.system_info)
 
 
 # Global GPU monitor instance
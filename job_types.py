@@ -1,14 +1,41 @@
 """
 Job types and execution logic for the GPU Mini-Cluster Orchestrator
 """
+import os
+import sys
 import time
 import random
 import threading
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from enum import Enum
-from typing import Any, Dict, Optional, Callable
-from datetime import datetime
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from typing import Any, Dict, List, Optional, Callable
+import numpy as np
+
+from utils import monotonic_ns_to_iso, RWLock
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from scipy.linalg.blas import get_blas_funcs
+    SCIPY_BLAS_AVAILABLE = True
+except ImportError:
+    SCIPY_BLAS_AVAILABLE = False
+
+try:
+    from threadpoolctl import threadpool_limits
+    THREADPOOLCTL_AVAILABLE = True
+except ImportError:
+    THREADPOOLCTL_AVAILABLE = False
+
+try:
+    import cupy
+    CUPY_AVAILABLE = cupy.cuda.runtime.getDeviceCount() > 0
+except (ImportError, RuntimeError):  # Not installed, or no CUDA driver/device
+    CUPY_AVAILABLE = False
 
 
 class JobStatus(Enum):
@@ -20,7 +47,7 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
-class JobPriority(Enum):
+class JobPriority(IntEnum):
     """Job priority enumeration"""
     LOW = 1
     NORMAL = 2
@@ -28,22 +55,36 @@ class JobPriority(Enum):
     CRITICAL = 4
 
 
-@dataclass
+# Plain values for serialization, looked up once rather than through the .value descriptor per job
+_STATUS_VALUES = {status: status.value for status in JobStatus}
+_PRIORITY_VALUES = {priority: priority.value for priority in JobPriority}
+
+
+class JobCancelled(Exception):
+    """Raised by an executor that stopped early because its job was cancelled"""
+
+
+@dataclass(slots=True)
 class Job:
     """Job data structure"""
     job_id: str
     job_type: str
     priority: JobPriority
     status: JobStatus
-    created_at: datetime
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    created_at_ns: int = field(default_factory=time.monotonic_ns)
+    started_at_ns: Optional[int] = None    # time.monotonic_ns()
+    completed_at_ns: Optional[int] = None  # time.monotonic_ns()
+    started_at_iso: Optional[str] = None    # Formatted when started_at_ns is set
+    completed_at_iso: Optional[str] = None  # Formatted when completed_at_ns is set
+    created_at_iso: Optional[str] = None    # Formatted on first serialization
+    finished_dict: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)  # to_dict() once finished
     worker_id: Optional[str] = None
     parameters: Dict[str, Any] = None
     result: Optional[Any] = None
     error_message: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 3
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False, compare=False)
     
     def __post_init__(self):
         if self.parameters is None:
@@ -52,20 +93,22 @@ class Job:
     @property
     def duration(self) -> Optional[float]:
         """Calculate job duration in seconds"""
-        if self.started_at and self.completed_at:
-            return (self.completed_at - self.started_at).total_seconds()
+        if self.started_at_ns is not None and self.completed_at_ns is not None:
+            return (self.completed_at_ns - self.started_at_ns) / 1e9
         return None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert job to dictionary for serialization"""
+        if self.created_at_iso is None:
+            self.created_at_iso = monotonic_ns_to_iso(self.created_at_ns)
         return {
             'job_id': self.job_id,
             'job_type': self.job_type,
-            'priority': self.priority.value,
-            'status': self.status.value,
-            'created_at': self.created_at.isoformat(),
-            'started_at': self.started_at.isoformat() if self.started_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'priority': _PRIORITY_VALUES[self.priority],
+            'status': _STATUS_VALUES[self.status],
+            'created_at': self.created_at_iso,
+            'started_at': self.started_at_iso,
+            'completed_at': self.completed_at_iso,
             'worker_id': self.worker_id,
             'parameters': self.parameters,
             'result': self.result,
@@ -76,91 +119,215 @@ class Job:
         }
 
 
-class JobExecutor(ABC):
-    """Abstract base class for job executors"""
+# Iterations per vectorized block when numba is unavailable; caps temporary arrays at 8 MB each
+COMPUTE_BLOCK_SIZE = 1 << 20
+
+# Each job thread gets its own NumPy generator, seeded from an independent child of one root sequence
+_seed_sequence = np.random.SeedSequence()
+_seed_lock = threading.Lock()  # SeedSequence.spawn is not thread-safe
+_thread_local = threading.local()
+
+# Whole-node matrix jobs raise the process-wide BLAS thread limit, so they multiply alone:
+# ordinary multiplies share the read side, solo ones take the write side
+_solo_gate = RWLock()
+
+
+def _rng() -> np.random.Generator:
+    """Return the calling thread's random generator"""
+    rng = getattr(_thread_local, 'rng', None)
+    if rng is None:
+        with _seed_lock:
+            seed, = _seed_sequence.spawn(1)
+        rng = _thread_local.rng = np.random.default_rng(seed)
+    return rng
+
+
+if NUMBA_AVAILABLE:
+    # fastmath lets the reduction vectorize; cache keeps the compiled kernel in __pycache__ across runs.
+    # nogil lets pool threads run kernels side by side without stalling the scheduler and server threads.
+    @njit(fastmath=True, cache=True, nogil=True)
+    def _compute_kernel(iterations):
+        """Native version of the compute job loop.
+        
+        Single-threaded on purpose: with the GIL released, concurrent compute jobs already
+        run in parallel on the job pool, and numba's default threading layer aborts on
+        concurrent parallel launches.
+        """
+        result = 0.0
+        for i in range(iterations):
+            result += i * random.random()
+        return result
+    
+    @njit(cache=True, nogil=True)
+    def _matrix_fallback_kernel(n, tile=64):
+        """Native version of the matrix fallback loop, walked in cache-sized tiles"""
+        result = 0
+        for ii in range(0, n, tile):
+            for jj in range(0, n, tile):
+                for i in range(ii, min(ii + tile, n)):
+                    for j in range(jj, min(jj + tile, n)):
+                        result += (i * j) % 1000
+        return result
+
+
+def pin_blas_threads():
+    """Limit BLAS to one thread per call (process-wide) when threadpoolctl is installed.
+    
+    For callers that run jobs in parallel, like the simulator's job pool: one BLAS thread
+    per job avoids cores x jobs threads fighting over the CPU. Solo matrix jobs lift it.
+    """
+    if THREADPOOLCTL_AVAILABLE:
+        threadpool_limits(1, user_api='blas')
+
+
+def warm_up_kernels():
+    """Compile the JIT kernels so the first real job doesn't pay for it"""
+    if NUMBA_AVAILABLE:
+        _compute_kernel(1)
+        _matrix_fallback_kernel(1)
+
+
+class JobExecutor:
+    """Base class for job executors"""
+    
+    # The job type this executor handles; the registry dispatches on it directly.
+    # Executors that match jobs some other way leave it as None and override can_execute.
+    JOB_TYPE: Optional[str] = None
     
-    @abstractmethod
     def execute(self, job: Job) -> Any:
         """Execute a job and return the result"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def can_execute(self, job: Job) -> bool:
         """Check if this executor can handle the given job"""
-        pass
+        return job.job_type == self.JOB_TYPE
 
 
 class SleepJobExecutor(JobExecutor):
     """Executor for sleep-based jobs (simulating GPU work)"""
     
+    JOB_TYPE = "sleep"
+    
     def execute(self, job: Job) -> Any:
         """Execute sleep job"""
         duration = job.parameters.get('duration', 5)
-        time.sleep(duration)
+        if job.cancel_event.wait(duration):
+            raise JobCancelled(f"Job {job.job_id} cancelled")
         return f"Sleep job completed after {duration} seconds"
-    
-    def can_execute(self, job: Job) -> bool:
-        """Check if this is a sleep job"""
-        return job.job_type == "sleep"
 
 
 class ComputeJobExecutor(JobExecutor):
     """Executor for compute-intensive jobs (simulating GPU computation)"""
     
+    JOB_TYPE = "compute"
+    
     def execute(self, job: Job) -> Any:
         """Execute compute job"""
         iterations = job.parameters.get('iterations', 1000000)
-        result = 0
         
         # Simulate GPU computation
-        for i in range(iterations):
-            result += i * random.random()
+        if NUMBA_AVAILABLE:
+            result = _compute_kernel(iterations)
+        else:
+            # Same sum as the loop, as one dot product per block
+            result = 0.0
+            for start in range(0, iterations, COMPUTE_BLOCK_SIZE):
+                block = min(COMPUTE_BLOCK_SIZE, iterations - start)
+                result += float(np.arange(start, start + block, dtype=np.float64) @ _rng().random(block))
         
         return f"Compute job completed: {result:.2f}"
-    
-    def can_execute(self, job: Job) -> bool:
-        """Check if this is a compute job"""
-        return job.job_type == "compute"
 
 
 class MatrixJobExecutor(JobExecutor):
     """Executor for matrix operations (simulating GPU matrix computations)"""
     
+    JOB_TYPE = "matrix"
+    
+    def __init__(self):
+        # Per job thread float32 scratch buffers, grown to the largest size seen
+        self._local = threading.local()
+        # Call BLAS sgemm directly when scipy is installed, skipping np.dot's dispatch
+        self._sgemm = get_blas_funcs('gemm', dtype=np.float32) if SCIPY_BLAS_AVAILABLE else None
+    
+    def _buffers(self, size: int):
+        """Return three size x size float32 views into this thread's reused buffers"""
+        local = self._local
+        n = size * size
+        if getattr(local, 'capacity', 0) < n:
+            local.buffers = [np.empty(n, dtype=np.float32) for _ in range(3)]
+            local.capacity = n
+        return [buf[:n].reshape(size, size) for buf in local.buffers]
+    
     def execute(self, job: Job) -> Any:
         """Execute matrix job"""
         size = job.parameters.get('matrix_size', 1000)
         
+        # 'simulate' mode only reports the product's shape, which is known without multiplying
+        if job.parameters.get('mode', 'real') == 'simulate':
+            return f"Matrix multiplication simulated: {(size, size)}"
+        
+        # Run on the GPU when one is available
+        if CUPY_AVAILABLE:
+            return self._execute_cupy(size)
+        
         # Try to use numpy for matrix multiplication
         try:
-            import numpy as np
-            # Create random matrices
-            a = np.random.rand(size, size)
-            b = np.random.rand(size, size)
+            a, b, result = self._buffers(size)
+            rng = _rng()
+            # Fill random float32 matrices in place
+            rng.random(out=a, dtype=np.float32)
+            rng.random(out=b, dtype=np.float32)
             # Perform matrix multiplication
-            result = np.dot(a, b)
-            return f"Matrix multiplication completed: {result.shape}"
-        except (ImportError, OSError, RuntimeError) as e:
+            if job.parameters.get('solo') and THREADPOOLCTL_AVAILABLE:
+                # A whole-node job may use every core. BLAS limits are process-wide, so it waits
+                # for other multiplies to drain, holds them off, then restores the single-thread pin.
+                with _solo_gate.write, threadpool_limits(os.cpu_count(), user_api='blas'):
+                    self._multiply(a, b, result)
+            else:
+                with _solo_gate.read:
+                    self._multiply(a, b, result)
+            # Read back the trace, O(n), so the result is observed without copying n^2 values
+            return f"Matrix multiplication completed: {result.shape}, trace {float(result.trace()):.2f}"
+        except (OSError, RuntimeError) as e:
             # Fallback simulation if numpy fails for any reason
             # Simulate matrix multiplication with nested loops
-            result = 0
-            iterations = min(size, 100)  # Limit iterations for performance
-            for i in range(iterations):
-                for j in range(iterations):
-                    result += (i * j) % 1000  # Simulate computation
+            if NUMBA_AVAILABLE:
+                iterations = size
+                result = _matrix_fallback_kernel(iterations)
+            else:
+                result = 0
+                iterations = min(size, 100)  # Limit iterations for performance
+                for i in range(iterations):
+                    for j in range(iterations):
+                        result += (i * j) % 1000  # Simulate computation
             
             # Simulate processing time
             time.sleep(0.1)
             
             return f"Matrix simulation completed (fallback): {result} (size: {iterations}x{iterations})"
     
-    def can_execute(self, job: Job) -> bool:
-        """Check if this is a matrix job"""
-        return job.job_type == "matrix"
+    def _multiply(self, a: np.ndarray, b: np.ndarray, result: np.ndarray):
+        """Write a @ b into result"""
+        if self._sgemm is not None:
+            # BLAS is column-major: C = A @ B is C.T = B.T @ A.T, and the .T views are Fortran-ordered
+            self._sgemm(1.0, b.T, a.T, c=result.T, overwrite_c=1)
+        else:
+            np.dot(a, b, out=result)
+    
+    def _execute_cupy(self, size: int) -> str:
+        """Multiply random float32 matrices with cuBLAS; cupy's memory pool reuses the device buffers"""
+        a = cupy.random.random((size, size), dtype=cupy.float32)
+        b = cupy.random.random((size, size), dtype=cupy.float32)
+        result = a @ b
+        trace = float(result.trace())  # Copying the scalar back waits for the kernels to finish
+        return f"GPU matrix multiplication completed: {result.shape}, trace {trace:.2f}"
 
 
 class FaultInjectionJobExecutor(JobExecutor):
     """Executor that can simulate failures for testing"""
     
+    JOB_TYPE = "fault_injection"
+    
     def execute(self, job: Job) -> Any:
         """Execute job with potential failure injection"""
         failure_rate = job.parameters.get('failure_rate', 0.1)
@@ -169,19 +336,17 @@ class FaultInjectionJobExecutor(JobExecutor):
             raise Exception(f"Simulated failure in job {job.job_id}")
         
         duration = job.parameters.get('duration', 3)
-        time.sleep(duration)
+        if job.cancel_event.wait(duration):
+            raise JobCancelled(f"Job {job.job_id} cancelled")
         return f"Fault injection job completed after {duration} seconds"
-    
-    def can_execute(self, job: Job) -> bool:
-        """Check if this is a fault injection job"""
-        return job.job_type == "fault_injection"
 
 
 class JobExecutorRegistry:
     """Registry for job executors"""
     
     def __init__(self):
-        self._executors = []
+        self._executors: Dict[str, JobExecutor] = {}  # By JOB_TYPE
+        self._matchers: List[JobExecutor] = []  # Executors without a JOB_TYPE, checked in order
         self._register_default_executors()
     
     def _register_default_executors(self):
@@ -193,11 +358,17 @@ class JobExecutorRegistry:
     
     def register(self, executor: JobExecutor):
         """Register a job executor"""
-        self._executors.append(executor)
+        if executor.JOB_TYPE is not None:
+            self._executors[executor.JOB_TYPE] = executor
+        else:
+            self._matchers.append(executor)
     
     def get_executor(self, job: Job) -> Optional[JobExecutor]:
         """Get executor for a job"""
-        for executor in self._executors:
+        executor = self._executors.get(job.job_type)
+        if executor is not None:
+            return executor
+        for executor in self._matchers:
             if executor.can_execute(job):
                 return executor
         return None
@@ -220,12 +391,14 @@ def create_job(job_type: str, priority: JobPriority = JobPriority.NORMAL,
     """Create a new job"""
     from utils import generate_job_id
     
+    # Interned so registry lookups and JOB_TYPE comparisons hit the identity fast path
+    job_type = sys.intern(job_type)
+    
     return Job(
         job_id=generate_job_id(job_type, priority.name.lower()),
         job_type=job_type,
         priority=priority,
         status=JobStatus.PENDING,
-        created_at=datetime.now(),
         parameters=parameters or {}
     )
 
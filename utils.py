@@ -2,8 +2,11 @@
 Utility functions and logging for the GPU Mini-Cluster Orchestrator
 """
 import logging
+import os
+import random
+import sys
+import threading
 import time
-import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional
 from colorama import Fore, Style, init
@@ -11,6 +14,9 @@ from colorama import Fore, Style, init
 # Initialize colorama for colored output
 init(autoreset=True)
 
+# Only color printed output when someone is looking at it
+_STDOUT_IS_TTY = sys.stdout.isatty()
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colored output"""
@@ -23,14 +29,24 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': Fore.MAGENTA + Style.BRIGHT
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names, built once instead of per record
+        self._level_prefix = {level: f"{color}{level}{Style.RESET_ALL}" for level, color in self.COLORS.items()}
+    
     def format(self, record):
-        log_color = self.COLORS.get(record.levelname, '')
-        record.levelname = f"{log_color}{record.levelname}{Style.RESET_ALL}"
+        # Set a separate attribute; rewriting levelname would leak colors into other handlers
+        levelname = record.levelname
+        record.colored_levelname = self._level_prefix.get(levelname, levelname)
         return super().format(record)
 
 
-def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
-    """Setup logging with colored console output and optional file output"""
+def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None,
+                  use_colors: Optional[bool] = None) -> logging.Logger:
+    """Setup logging with colored console output and optional file output.
+    
+    Colors default to on only when stderr is a terminal.
+    """
     
     # Create logger
     logger = logging.getLogger("orchestrator")
@@ -39,12 +55,20 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
     # Clear existing handlers
     logger.handlers.clear()
     
-    # Console handler with colors
+    # Console handler, with colors when enabled
     console_handler = logging.StreamHandler()
-    console_formatter = ColoredFormatter(
-        '%(asctime)s | %(levelname)s | %(name)s | %(message)s',
-        datefmt='%H:%M:%S'
-    )
+    if use_colors is None:
+        use_colors = console_handler.stream.isatty()
+    if use_colors:
+        console_formatter = ColoredFormatter(
+            '%(asctime)s | %(colored_levelname)s | %(name)s | %(message)s',
+            datefmt='%H:%M:%S'
+        )
+    else:
+        console_formatter = logging.Formatter(
+            '%(asctime)s | %(levelname)s | %(name)s | %(message)s',
+            datefmt='%H:%M:%S'
+        )
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
     
@@ -61,32 +85,40 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
     return logger
 
 
+# Offset from time.monotonic_ns() to wall-clock epoch nanoseconds, fixed at import
+_MONOTONIC_TO_EPOCH_NS = time.time_ns() - time.monotonic_ns()
+
+
+def monotonic_ns_to_iso(monotonic_ns: int) -> str:
+    """Convert a time.monotonic_ns() timestamp to a local ISO 8601 string"""
+    return datetime.fromtimestamp((monotonic_ns + _MONOTONIC_TO_EPOCH_NS) / 1e9).isoformat()
+
+
+# Job type prefixes
+_JOB_TYPE_PREFIXES = {
+    "sleep": ("io", "wait", "idle", "pause", "delay"),
+    "compute": ("calc", "process", "analyze", "compute", "run"),
+    "matrix": ("matrix", "gpu", "tensor", "linear", "algebra"),
+    "fault_injection": ("test", "check", "verify", "validate", "inject")
+}
+_DEFAULT_PREFIXES = ("job",)
+
+# Priority suffixes
+_PRIORITY_SUFFIXES = {
+    "low": ("batch", "background", "low-priority"),
+    "normal": ("standard", "regular", "normal"),
+    "high": ("urgent", "priority", "important"),
+    "critical": ("critical", "emergency", "immediate")
+}
+_DEFAULT_SUFFIXES = ("normal",)
+
+
 def generate_job_id(job_type: str = "compute", priority: str = "normal") -> str:
     """Generate a realistic job ID with descriptive naming"""
-    import random
-    
-    # Job type prefixes
-    type_prefixes = {
-        "sleep": ["io", "wait", "idle", "pause", "delay"],
-        "compute": ["calc", "process", "analyze", "compute", "run"],
-        "matrix": ["matrix", "gpu", "tensor", "linear", "algebra"],
-        "fault_injection": ["test", "check", "verify", "validate", "inject"]
-    }
-    
-    # Priority suffixes
-    priority_suffixes = {
-        "low": ["batch", "background", "low-priority"],
-        "normal": ["standard", "regular", "normal"],
-        "high": ["urgent", "priority", "important"],
-        "critical": ["critical", "emergency", "immediate"]
-    }
-    
-    # Get random prefix and suffix
-    prefix = random.choice(type_prefixes.get(job_type, ["job"]))
-    suffix = random.choice(priority_suffixes.get(priority.lower(), ["normal"]))
-    
-    # Add a random number for uniqueness
-    number = random.randint(1000, 9999)
+    # Pick a random prefix and a number for uniqueness (1000-9999); one random() call each
+    prefixes = _JOB_TYPE_PREFIXES.get(job_type, _DEFAULT_PREFIXES)
+    prefix = prefixes[int(random.random() * len(prefixes))]
+    number = 1000 + int(random.random() * 9000)
     
     # Create realistic job name
     if job_type == "matrix":
@@ -94,25 +126,31 @@ def generate_job_id(job_type: str = "compute", priority: str = "normal") -> str:
     elif job_type == "fault_injection":
         return f"{prefix}-test-{number}"
     else:
+        suffixes = _PRIORITY_SUFFIXES.get(priority.lower(), _DEFAULT_SUFFIXES)
+        suffix = suffixes[int(random.random() * len(suffixes))]
         return f"{prefix}-{suffix}-{number}"
 
 
 def generate_worker_id() -> str:
     """Generate a unique worker ID"""
-    return f"worker_{uuid.uuid4().hex[:8]}"
+    return f"worker_{os.urandom(4).hex()}"
+
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 
 def format_bytes(bytes_value: int) -> str:
     """Format bytes into human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} PB"
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    unit = min(len(_BYTE_UNITS) - 1, max(0, (int(bytes_value).bit_length() - 1) // 10))
+    return f"{bytes_value / (1 << (10 * unit)):.1f} {_BYTE_UNITS[unit]}"
 
 
 def format_percentage(value: float) -> str:
     """Format percentage with color coding"""
+    if not _STDOUT_IS_TTY:
+        return f"{value:.1%}"
+    
     if value >= 0.9:
         color = Fore.RED
     elif value >= 0.7:
@@ -138,17 +176,94 @@ class Timer:
     
     def __init__(self, operation_name: str = "Operation"):
         self.operation_name = operation_name
-        self.start_time = None
-        self.end_time = None
+        self.start_time = None  # time.perf_counter_ns()
+        self.end_time = None    # time.perf_counter_ns()
     
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = time.time()
-        duration = self.end_time - self.start_time
-        print(f"{Fore.CYAN}{self.operation_name} completed in {format_duration(duration)}{Style.RESET_ALL}")
+        self.end_time = time.perf_counter_ns()
+        message = f"{self.operation_name} completed in {format_duration(self.duration)}"
+        print(f"{Fore.CYAN}{message}{Style.RESET_ALL}" if _STDOUT_IS_TTY else message)
+    
+    @property
+    def duration(self) -> float:
+        """Elapsed seconds"""
+        return (self.end_time - self.start_time) / 1e9
+
+
+class _LockSide:
+    """Context manager for one side of an RWLock"""
+    
+    __slots__ = ('_acquire', '_release')
+    
+    def __init__(self, acquire, release):
+        self._acquire = acquire
+        self._release = release
+    
+    def __enter__(self):
+        self._acquire()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._release()
+
+
+class RWLock:
+    """Reader-writer lock: any number of readers, or one writer.
+    
+    Use `with lock.read:` for read-only sections and `with lock.write:` for
+    changes. The writer side is re-entrant, and the writing thread may also take
+    the read side. Waiting writers hold off new readers so they are not starved.
+    """
+    
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None  # Thread ident of the current writer
+        self._write_depth = 0
+        self._writers_waiting = 0
+        self.read = _LockSide(self.acquire_read, self.release_read)
+        self.write = _LockSide(self.acquire_write, self.release_write)
+    
+    def acquire_read(self):
+        with self._cond:
+            if self._writer == threading.get_ident():
+                self._write_depth += 1  # Nested read inside our own write section
+                return
+            while self._writer is not None or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+    
+    def release_read(self):
+        with self._cond:
+            if self._writer == threading.get_ident():
+                self._write_depth -= 1
+                return
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+    
+    def acquire_write(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            self._writers_waiting += 1
+            while self._writer is not None or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+    
+    def release_write(self):
+        with self._cond:
+            self._write_depth -= 1
+            if not self._write_depth:
+                self._writer = None
+                self._cond.notify_all()
 
 
 def safe_get(dictionary: Dict[str, Any], key: str, default: Any = None) -> Any: